@@ -1,11 +1,214 @@
+from dataclasses import dataclass, replace
+from math import pi
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from scipy.integrate import solve_ivp
+import numba
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 
+_PI_OVER_4 = 0.25 * pi
+
+@dataclass(frozen=True, slots=True)
+class Params:
+    """Immutable per-run snapshot of the GUI parameters.
+
+    frozen + slots pins the fields at fixed offsets (no __dict__) and
+    guarantees a worker thread mid-solve can never observe later edits.
+    """
+    p_0: float
+    p_2: float
+    D: float
+    gamma: float
+    v_0: float
+    v_expand: float
+    mass: float
+    fric1: float
+    fric2: float
+    end_time: float
+    n_points: float
+
+
+@numba.njit(cache=True, fastmath=True)
+def _nomad_rhs(t, x1x2, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, out):
+    """Define the system of first-order ODEs.
+
+    Module-level and numba-compiled so the integrator's thousands of
+    calls per run stay out of the interpreter. p0_v0g is the hoisted
+    pressure numerator p_0 * v_0**gamma, computed once per run so each
+    call pays a single pow instead of two.
+    """
+    x1, x2 = x1x2[0], x1x2[1]  # unpack position and velocity
+
+    # Calculate volume and pressure at current position
+    # (p_0 / ((v_t/v_0)**gamma) with the constant numerator prefolded).
+    # gamma = 1.4 is the air default, so give it a fast path: x**1.4 as
+    # x * exp(0.4*ln(x)) skips libm pow's general-case handling.
+    v_t = v_expand + v_0 + area * x1
+    if gamma == 1.4:
+        v_t_gamma = v_t * np.exp(0.4 * np.log(v_t))
+    else:
+        v_t_gamma = v_t ** gamma
+    p_t = p0_v0g / v_t_gamma
+
+    # Choose friction based on position, as a select (not a branch) so
+    # the compiled loop gets a cmov near the 30 mm threshold
+    sel = 1.0 if x1 <= 0.03 else 0.0
+    friction = fric2 + (fric1 - fric2) * sel
+
+    # Calculate acceleration
+    pressure_force = (p_t - p_2) * area
+
+    # Fill the caller-owned buffer instead of allocating per call
+    out[0] = x2  # velocity
+    out[1] = (pressure_force - friction) / mass
+
+
+@numba.njit(cache=True, fastmath=True)
+def _integrate_rk45(t_eval, y0, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, rtol, atol):
+    """Adaptive Dormand-Prince (RK45) integration over an output grid.
+
+    The whole step loop runs compiled instead of scipy's Python driver
+    calling back into the RHS once per stage. Steps adapt to the embedded
+    4th/5th-order error estimate and are clamped so every t_eval point is
+    landed on exactly; tolerances match solve_ivp's defaults unless the
+    caller loosens them.
+    """
+    n_out = t_eval.shape[0]
+    n_dim = y0.shape[0]
+    y_out = np.empty((n_dim, n_out))
+    y = y0.copy()
+    for j in range(n_dim):
+        y_out[j, 0] = y[j]
+
+    # All per-step work happens in these preallocated buffers; the RHS
+    # fills its out argument in place, so the step loop allocates nothing
+    k1 = np.empty(n_dim)
+    k2 = np.empty(n_dim)
+    k3 = np.empty(n_dim)
+    k4 = np.empty(n_dim)
+    k5 = np.empty(n_dim)
+    k6 = np.empty(n_dim)
+    k7 = np.empty(n_dim)
+    y_stage = np.empty(n_dim)
+    y_new = np.empty(n_dim)
+
+    t = t_eval[0]
+    h = (t_eval[-1] - t_eval[0]) / 100.0
+
+    for i in range(1, n_out):
+        t_target = t_eval[i]
+        while t < t_target - 1e-14:
+            h_step = min(h, t_target - t)
+            while True:
+                _nomad_rhs(t, y, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k1)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * 0.2 * k1[j]
+                _nomad_rhs(t + h_step * 0.2, y_stage, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k2)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (3.0 / 40.0 * k1[j]
+                                                  + 9.0 / 40.0 * k2[j])
+                _nomad_rhs(t + h_step * 0.3, y_stage, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k3)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (44.0 / 45.0 * k1[j]
+                                                  - 56.0 / 15.0 * k2[j]
+                                                  + 32.0 / 9.0 * k3[j])
+                _nomad_rhs(t + h_step * 0.8, y_stage, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k4)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (19372.0 / 6561.0 * k1[j]
+                                                  - 25360.0 / 2187.0 * k2[j]
+                                                  + 64448.0 / 6561.0 * k3[j]
+                                                  - 212.0 / 729.0 * k4[j])
+                _nomad_rhs(t + h_step * 8.0 / 9.0, y_stage, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k5)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (9017.0 / 3168.0 * k1[j]
+                                                  - 355.0 / 33.0 * k2[j]
+                                                  + 46732.0 / 5247.0 * k3[j]
+                                                  + 49.0 / 176.0 * k4[j]
+                                                  - 5103.0 / 18656.0 * k5[j])
+                _nomad_rhs(t + h_step, y_stage, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k6)
+                for j in range(n_dim):
+                    y_new[j] = y[j] + h_step * (35.0 / 384.0 * k1[j]
+                                                + 500.0 / 1113.0 * k3[j]
+                                                + 125.0 / 192.0 * k4[j]
+                                                - 2187.0 / 6784.0 * k5[j]
+                                                + 11.0 / 84.0 * k6[j])
+                _nomad_rhs(t + h_step, y_new, p0_v0g, p_2, area, gamma, v_0, v_expand, mass, fric1, fric2, k7)
+
+                # Embedded error estimate (5th minus 4th order solution)
+                norm = 0.0
+                for j in range(n_dim):
+                    err_j = h_step * ((35.0 / 384.0 - 5179.0 / 57600.0) * k1[j]
+                                      + (500.0 / 1113.0 - 7571.0 / 16695.0) * k3[j]
+                                      + (125.0 / 192.0 - 393.0 / 640.0) * k4[j]
+                                      + (-2187.0 / 6784.0 + 92097.0 / 339200.0) * k5[j]
+                                      + (11.0 / 84.0 - 187.0 / 2100.0) * k6[j]
+                                      - 1.0 / 40.0 * k7[j])
+                    scale = atol + rtol * max(abs(y[j]), abs(y_new[j]))
+                    norm += (err_j / scale) ** 2
+                norm = (norm / n_dim) ** 0.5
+
+                if norm <= 1.0 or h_step <= 1e-14:
+                    t += h_step
+                    for j in range(n_dim):
+                        y[j] = y_new[j]
+                    if norm > 0.0:
+                        h = h_step * min(5.0, max(0.2, 0.9 * norm ** -0.2))
+                    else:
+                        h = h_step * 5.0
+                    break
+                h_step *= max(0.2, 0.9 * norm ** -0.2)
+                h = h_step
+        for j in range(n_dim):
+            y_out[j, i] = y[j]
+    return y_out
+
+
+@numba.njit(cache=True, fastmath=True, parallel=True)
+def _sweep_trajectories(t_eval, args_grid, rtol, atol):
+    """Integrate one trajectory per row of args_grid, in parallel.
+
+    Each row carries the nine scalar RHS parameters. The integrations are
+    independent, so prange spreads them across cores; nopython mode means
+    no GIL contention between them.
+    """
+    n = args_grid.shape[0]
+    out = np.empty((n, 2, t_eval.shape[0]))
+    for i in numba.prange(n):
+        a = args_grid[i]
+        out[i] = _integrate_rk45(t_eval, np.zeros(2),
+                                 a[0], a[1], a[2], a[3], a[4], a[5], a[6],
+                                 a[7], a[8], rtol, atol)
+    return out
+
+
+@numba.njit(cache=True, fastmath=True)
+def _derive_state_arrays(x1, p0_v0g, area, gamma, v_0, v_expand):
+    """Volume and pressure along the whole trajectory in one fused pass,
+    sharing the prefolded pressure numerator with the RHS instead of
+    double-passing the array through NumPy temporaries."""
+    n = x1.shape[0]
+    v_t = np.empty(n)
+    p_t = np.empty(n)
+    for i in range(n):
+        v = v_expand + v_0 + area * x1[i]
+        v_t[i] = v
+        p_t[i] = p0_v0g / (v ** gamma)
+    return v_t, p_t
+
+
+def _warm_up_kernels():
+    """Compile-or-load the jitted integrator before the first real run"""
+    _integrate_rk45(np.linspace(0.0, 1e-6, 2), np.zeros(2),
+                    1.0, 1.0, 1.0, 1.4, 1.0, 0.0, 1.0, 0.0, 0.0,
+                    1e-3, 1e-6)
+    _derive_state_arrays(np.zeros(2), 1.0, 1.0, 1.4, 1.0, 0.0)
+    _sweep_trajectories(np.linspace(0.0, 1e-6, 2),
+                        np.ones((1, 9)), 1e-3, 1e-6)
+
+
 class SpringerSimulatorGUI:
     def __init__(self, root):
         self.root = root
@@ -27,6 +230,11 @@ class SpringerSimulatorGUI:
             'n_points': 1500    # Number of evaluation points
         }
         
+        self._t_eval = None
+        self._t_eval_key = None
+        self._blit_backgrounds = None
+
+        _warm_up_kernels()  # absorb JIT compile/load before the first run
         self.setup_gui()
         self.run_simulation()  # Initial simulation
         
@@ -52,13 +260,51 @@ class SpringerSimulatorGUI:
         button_frame.pack(pady=20, fill=tk.X)
         
         run_button = ttk.Button(button_frame, text="Run Simulation", 
-                               command=self.run_simulation_threaded)
+                               command=lambda: self.run_simulation_threaded(preview=False))
         run_button.pack(fill=tk.X, pady=5)
         
+        # Preview trades accuracy for latency while dialing in parameters;
+        # the Run button always does a full-accuracy solve
+        self.preview_var = tk.BooleanVar(value=False)
+        preview_check = ttk.Checkbutton(button_frame,
+                                        text="Preview (fast, coarse)",
+                                        variable=self.preview_var)
+        preview_check.pack(fill=tk.X, pady=2)
+        
         reset_button = ttk.Button(button_frame, text="Reset to Defaults", 
                                  command=self.reset_parameters)
         reset_button.pack(fill=tk.X, pady=5)
         
+        # Sweep controls: vary one parameter over a range and overlay the
+        # resulting trajectories
+        sweep_frame = ttk.LabelFrame(control_frame, text="Parameter Sweep")
+        sweep_frame.pack(fill=tk.X, pady=10)
+        
+        sweepable = ['p_0', 'p_2', 'D', 'gamma', 'v_0', 'v_expand',
+                     'mass', 'fric1', 'fric2']
+        self.sweep_param_var = tk.StringVar(value='p_0')
+        param_row = ttk.Frame(sweep_frame)
+        param_row.pack(fill=tk.X, pady=2)
+        ttk.Label(param_row, text="Parameter", width=10).pack(side=tk.LEFT)
+        sweep_combo = ttk.Combobox(param_row, textvariable=self.sweep_param_var,
+                                   values=sweepable, state='readonly', width=12)
+        sweep_combo.pack(side=tk.LEFT, padx=5)
+        
+        self.sweep_start_var = tk.DoubleVar(value=200000)
+        self.sweep_stop_var = tk.DoubleVar(value=800000)
+        self.sweep_steps_var = tk.IntVar(value=8)
+        for label, var in (("Start", self.sweep_start_var),
+                           ("Stop", self.sweep_stop_var),
+                           ("Steps", self.sweep_steps_var)):
+            row = ttk.Frame(sweep_frame)
+            row.pack(fill=tk.X, pady=2)
+            ttk.Label(row, text=label, width=10).pack(side=tk.LEFT)
+            ttk.Entry(row, textvariable=var, width=14).pack(side=tk.LEFT, padx=5)
+        
+        sweep_button = ttk.Button(sweep_frame, text="Sweep",
+                                  command=self.run_sweep_threaded)
+        sweep_button.pack(fill=tk.X, pady=5)
+        
         # Status label
         self.status_label = ttk.Label(control_frame, text="Ready", 
                                      foreground="green")
@@ -131,114 +377,336 @@ class SpringerSimulatorGUI:
         self.fig.subplots_adjust(left=0.08, bottom=0.08, right=0.95, top=0.92, 
                                 wspace=0.25, hspace=0.35)
         
+        self._build_static_axes()
+
         # Embed in tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, parent)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-    def system(self, t, x1x2):
-        """Define the system of first-order ODEs"""
-        x1, x2 = x1x2  # unpack position and velocity
-        
-        # Calculate area
-        area = np.pi * (self.params['D']**2) / 4
-        
-        # Calculate volume and pressure at current position
-        v_t = self.params['v_expand']+self.params['v_0'] + area * x1 
-        p_t = (self.params['p_0'] / ((v_t / self.params['v_0']) ** self.params['gamma']))
-        
-        # Set the equations
-        dx1dt = x2  # velocity
-        
-        # Choose friction based on position
-        friction = self.params['fric1'] if x1 <= 0.03 else self.params['fric2']
-        
-        # Calculate acceleration
-        pressure_force = (p_t - self.params['p_2']) * area
-        dx2dt = (pressure_force - friction) / self.params['mass']
-        
-        return [dx1dt, dx2dt]
+        # Recapture blit backgrounds after every full draw (first draw,
+        # resizes, sweep renders); also paints the animated lines so they
+        # survive backend-initiated redraws
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
+    def _build_static_axes(self):
+        """Create the persistent line artists and static axis styling.
+
+        Called at figure build, and again after a sweep: the envelope view
+        clears the axes, which destroys the persistent lines.
+        """
+        (self.line1,) = self.ax1.plot([], [], 'b-', linewidth=2)
+        (self.line2,) = self.ax2.plot([], [], 'r-', linewidth=2)
+        (self.line3,) = self.ax3.plot([], [], 'm-', linewidth=2)
+        (self.line4,) = self.ax4.plot([], [], 'c-', linewidth=2)
+        self._persistent_lines = [self.line1, self.line2, self.line3, self.line4]
+        for line in self._persistent_lines:
+            # Animated artists are excluded from full draws, which keeps
+            # the captured backgrounds clean for blitting
+            line.set_animated(True)
+        self._blit_backgrounds = None
+        for ax, ylabel, title in (
+                (self.ax1, 'Position (m)', 'Position vs Time'),
+                (self.ax2, 'Velocity (m/s)', 'Velocity vs Time'),
+                (self.ax3, 'Volume (m³)', 'Volume vs Time'),
+                (self.ax4, 'Pressure (Pa)', 'Pressure vs Time')):
+            ax.set_xlabel('Time (s)')
+            ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            ax.grid(True)
         
     def run_simulation(self):
+        """Synchronous compute + render; used for the initial run"""
         try:
-            # Update parameters from GUI
-            for key, var in self.param_vars.items():
-                self.params[key] = var.get()
-            
-            # Initial conditions
-            x0 = [0, 0]  # Initial state [x(0), x'(0)]
-            t_span = (0, self.params['end_time'])
-            t_eval = np.linspace(0, self.params['end_time'], int(self.params['n_points']))
-            
-            # Solve ODE
-            sol = solve_ivp(self.system, t_span, x0, t_eval=t_eval)
-            
-            if not sol.success:
-                raise Exception("ODE solver failed")
-            
-            # Calculate derived quantities
-            area = np.pi * (self.params['D']**2) / 4
-            v_t = self.params['v_expand']+self.params['v_0'] + area * sol.y[0]
-            p_t = self.params['p_0'] / ((v_t / self.params['v_0']) ** self.params['gamma'])
-            
-            # Clear previous plots
-            for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
-                ax.clear()
-            
-            # Plot 1: Position vs Time
-            self.ax1.plot(sol.t, sol.y[0], 'b-', linewidth=2)
-            self.ax1.set_xlabel('Time (s)')
-            self.ax1.set_ylabel('Position (m)')
-            self.ax1.set_title('Position vs Time')
-            self.ax1.grid(True)
-            
-            # Plot 2: Velocity vs Time
-            self.ax2.plot(sol.t, sol.y[1], 'r-', linewidth=2)
-            self.ax2.set_xlabel('Time (s)')
-            self.ax2.set_ylabel('Velocity (m/s)')
-            self.ax2.set_title('Velocity vs Time')
-            self.ax2.grid(True)
-            
-            # Plot 3: Volume vs Time
-            self.ax3.plot(sol.t, v_t, 'm-', linewidth=2)
-            self.ax3.set_xlabel('Time (s)')
-            self.ax3.set_ylabel('Volume (m³)')
-            self.ax3.set_title('Volume vs Time')
-            self.ax3.grid(True)
-            
-            # Plot 4: Pressure vs Time
-            self.ax4.plot(sol.t, p_t, 'c-', linewidth=2)
-            self.ax4.set_xlabel('Time (s)')
-            self.ax4.set_ylabel('Pressure (Pa)')
-            self.ax4.set_title('Pressure vs Time')
-            self.ax4.grid(True)
-            
-            # Update layout and canvas
-            self.fig.tight_layout()
-            self.canvas.draw()
-            
-            # Update status
-            self.status_label.config(text=f"Simulation completed successfully", 
-                                   foreground="green")
-            
-            # Display some key results
-            max_pos = np.max(sol.y[0])
-            max_vel = np.max(sol.y[1])
-            min_pressure = np.min(p_t)
-            
-            result_text = f"Max Position: {max_pos:.6f} m | Max Velocity: {max_vel:.3f} m/s | Min Pressure: {min_pressure:.0f} Pa"
-            self.status_label.config(text=result_text)
-            
+            self._render(self._compute(self._snapshot_params()))
         except Exception as e:
             messagebox.showerror("Error", f"Simulation failed: {str(e)}")
             self.status_label.config(text="Simulation failed", foreground="red")
-    
-    def run_simulation_threaded(self):
-        """Run simulation in a separate thread to prevent GUI freezing"""
+
+    def _update_params_from_vars(self):
+        """Sync the internal param dict from the GUI variables.
+
+        Tk variable reads must stay on the main thread, so callers grab a
+        snapshot here before handing work to the solver thread.
+        """
+        for key, var in self.param_vars.items():
+            self.params[key] = var.get()
+
+    def _snapshot_params(self):
+        """Immutable Params snapshot of the current GUI state.
+
+        Main thread only (reads the Tk variables); the returned frozen
+        dataclass is what crosses into worker threads.
+        """
+        self._update_params_from_vars()
+        return Params(**self.params)
+
+    def _eval_grid(self, params):
+        """Evaluation-time grid, cached across runs.
+
+        Every run and sweep allocates the same linspace when the user is
+        just tweaking physics parameters; rebuild it only when n_points or
+        end_time actually change.
+        """
+        key = (int(params.n_points), params.end_time)
+        if self._t_eval_key != key:
+            self._t_eval = np.linspace(0, params.end_time, key[0])
+            self._t_eval_key = key
+        return self._t_eval
+
+    def _compute(self, params, preview=False):
+        """Numeric half of a run: integrate and derive the state arrays.
+
+        Works on a parameter snapshot and touches no Tk or matplotlib
+        state, so it is safe on a worker thread. Preview mode loosens the
+        tolerances and coarsens the output grid for interactive tweaking.
+        """
+        if preview:
+            t_eval = np.linspace(0, params.end_time, 200)
+            rtol, atol = 1e-2, 1e-4
+        else:
+            t_eval = self._eval_grid(params)
+            rtol, atol = 1e-3, 1e-6
+
+        # Integrate with the compiled RK45 kernel; the jitted RHS takes
+        # the parameters as scalars, with the constant pressure numerator
+        # p_0 * v_0**gamma folded once per run
+        area = _PI_OVER_4 * params.D * params.D
+        p0_v0g = params.p_0 * params.v_0**params.gamma
+        rhs_args = (p0_v0g, params.p_2, area,
+                    params.gamma, params.v_0,
+                    params.v_expand, params.mass,
+                    params.fric1, params.fric2)
+        y = _integrate_rk45(t_eval, np.zeros(2), *rhs_args, rtol, atol)
+
+        if not np.all(np.isfinite(y)):
+            raise Exception("ODE solver failed")
+
+        # Calculate derived quantities in one fused compiled pass
+        v_t, p_t = _derive_state_arrays(
+            y[0], p0_v0g, area, params.gamma,
+            params.v_0, params.v_expand)
+
+        return {'t_eval': t_eval, 'y': y, 'v_t': v_t, 'p_t': p_t}
+
+    def _render(self, result):
+        """Rendering half of a run: update artists and widgets.
+
+        Tk and the Tk canvas backend are not thread-safe, so this must
+        only run on the main loop.
+        """
+        t_eval = result['t_eval']
+        y = result['y']
+
+        # Update the persistent lines in place instead of clearing
+        # and replotting; a preceding sweep cleared the axes (killing
+        # the persistent artists), so rebuild them if they are gone
+        if self.line1.axes is None:
+            for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
+                ax.clear()
+            self._build_static_axes()
+
+        self.line1.set_data(t_eval, y[0])
+        self.line2.set_data(t_eval, y[1])
+        self.line3.set_data(t_eval, result['v_t'])
+        self.line4.set_data(t_eval, result['p_t'])
+
+        limits_changed = False
+        for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
+            old_limits = (ax.get_xlim(), ax.get_ylim())
+            ax.relim()
+            ax.autoscale_view()
+            if (ax.get_xlim(), ax.get_ylim()) != old_limits:
+                limits_changed = True
+
+        if limits_changed or self._blit_backgrounds is None:
+            # Ticks/grid change with the limits, so the backgrounds are
+            # stale: one full draw, which also recaptures them
+            self.canvas.draw()
+        else:
+            # Static background intact: restore it and repaint only the
+            # four line artists (a partial-region copy, not a re-render)
+            self._blit_lines()
+
+        # Display some key results
+        max_pos = np.max(y[0])
+        max_vel = np.max(y[1])
+        min_pressure = np.min(result['p_t'])
+
+        result_text = f"Max Position: {max_pos:.6f} m | Max Velocity: {max_vel:.3f} m/s | Min Pressure: {min_pressure:.0f} Pa"
+        self.status_label.config(text=result_text, foreground="green")
+
+    def _on_canvas_draw(self, event):
+        """After any full draw: capture per-axes backgrounds and paint the
+        animated lines on top (the BlitManager pattern)."""
+        if self.line1.axes is None:
+            # Sweep view owns the axes; nothing to blit until the run
+            # path rebuilds its artists
+            self._blit_backgrounds = None
+            return
+        axes = (self.ax1, self.ax2, self.ax3, self.ax4)
+        self._blit_backgrounds = [self.canvas.copy_from_bbox(ax.bbox)
+                                  for ax in axes]
+        for ax, line in zip(axes, self._persistent_lines):
+            ax.draw_artist(line)
+
+    def _blit_lines(self):
+        """Redraw only the line artists over the cached backgrounds"""
+        axes = (self.ax1, self.ax2, self.ax3, self.ax4)
+        for background, ax, line in zip(self._blit_backgrounds, axes,
+                                        self._persistent_lines):
+            self.canvas.restore_region(background)
+            ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
+        self.canvas.flush_events()
+
+    def _report_failure(self, what, exc):
+        """Show a failure from a worker thread; main loop only"""
+        messagebox.showerror("Error", f"{what} failed: {str(exc)}")
+        self.status_label.config(text=f"{what} failed", foreground="red")
+
+    def run_simulation_threaded(self, preview=None):
+        """Run the numerics on a worker thread to prevent GUI freezing.
+
+        Only _compute runs off the main thread; the result is marshalled
+        back with root.after so all Tk and canvas work stays on the main
+        loop. preview=None follows the Preview checkbox; the Run button
+        passes preview=False to force a full-accuracy solve.
+        """
+        if preview is None:
+            preview = bool(self.preview_var.get())
+        try:
+            snapshot = self._snapshot_params()
+        except tk.TclError as e:
+            # A cleared or non-numeric entry; report it instead of letting
+            # the traceback die in the button callback
+            messagebox.showerror("Error", f"Invalid parameter value: {e}")
+            self.status_label.config(text="Invalid parameter", foreground="red")
+            return
         self.status_label.config(text="Running simulation...", foreground="orange")
-        thread = threading.Thread(target=self.run_simulation)
+        thread = threading.Thread(target=self._compute_to_main,
+                                  args=(snapshot, preview))
         thread.daemon = True
         thread.start()
-    
+
+    def _compute_to_main(self, params, preview=False):
+        """Worker-thread entry point for a single run"""
+        try:
+            result = self._compute(params, preview)
+        except Exception as e:
+            self.root.after(0, self._report_failure, "Simulation", e)
+            return
+        self.root.after(0, self._render, result)
+
+    def run_sweep(self):
+        """Synchronous sweep compute + render"""
+        try:
+            self._render_sweep(self._compute_sweep(self._snapshot_params(),
+                                                   *self._sweep_spec()))
+        except Exception as e:
+            messagebox.showerror("Error", f"Sweep failed: {str(e)}")
+            self.status_label.config(text="Sweep failed", foreground="red")
+
+    def _sweep_spec(self):
+        """Read the sweep controls (main thread only)"""
+        return (self.sweep_param_var.get(),
+                self.sweep_start_var.get(),
+                self.sweep_stop_var.get(),
+                max(2, int(self.sweep_steps_var.get())))
+
+    def _compute_sweep(self, params, sweep_key, start, stop, steps):
+        """Integrate one trajectory per swept value; worker-thread safe"""
+        values = np.linspace(start, stop, steps)
+
+        # One row of scalar RHS parameters per sweep value
+        args_grid = np.empty((len(values), 9))
+        for i, value in enumerate(values):
+            p = replace(params, **{sweep_key: value})
+            area = _PI_OVER_4 * p.D * p.D
+            args_grid[i] = (p.p_0 * p.v_0**p.gamma, p.p_2,
+                            area, p.gamma, p.v_0, p.v_expand,
+                            p.mass, p.fric1, p.fric2)
+
+        t_eval = self._eval_grid(params)
+        trajectories = _sweep_trajectories(args_grid=args_grid,
+                                           t_eval=t_eval,
+                                           rtol=1e-3, atol=1e-6)
+        return {'sweep_key': sweep_key, 'values': values,
+                't_eval': t_eval, 'trajectories': trajectories}
+
+    def _render_sweep(self, result):
+        """Overlay the sweep envelope; main loop only"""
+        sweep_key = result['sweep_key']
+        values = result['values']
+        t_eval = result['t_eval']
+        trajectories = result['trajectories']
+
+        # The envelope view replaces the persistent single-run artists;
+        # the next normal run rebuilds them
+        for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
+            ax.clear()
+
+        show_legend = len(values) <= 8
+        for i, value in enumerate(values):
+            label = f"{sweep_key}={value:g}"
+            self.ax1.plot(t_eval, trajectories[i, 0], linewidth=1, label=label)
+            self.ax2.plot(t_eval, trajectories[i, 1], linewidth=1, label=label)
+            self.ax3.plot(trajectories[i, 0], trajectories[i, 1], linewidth=1)
+
+        self.ax1.set_xlabel('Time (s)')
+        self.ax1.set_ylabel('Position (m)')
+        self.ax1.set_title(f'Position vs Time ({sweep_key} sweep)')
+        self.ax1.grid(True)
+        if show_legend:
+            self.ax1.legend(fontsize=8)
+
+        self.ax2.set_xlabel('Time (s)')
+        self.ax2.set_ylabel('Velocity (m/s)')
+        self.ax2.set_title('Velocity vs Time')
+        self.ax2.grid(True)
+
+        self.ax3.set_xlabel('Position (m)')
+        self.ax3.set_ylabel('Velocity (m/s)')
+        self.ax3.set_title('Velocity vs Position')
+        self.ax3.grid(True)
+
+        max_vels = trajectories[:, 1, :].max(axis=1)
+        self.ax4.plot(values, max_vels, 'ko-', linewidth=2)
+        self.ax4.set_xlabel(sweep_key)
+        self.ax4.set_ylabel('Max Velocity (m/s)')
+        self.ax4.set_title(f'Max Velocity vs {sweep_key}')
+        self.ax4.grid(True)
+
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
+
+        self.status_label.config(
+            text=f"Sweep complete: {sweep_key} over {len(values)} values "
+                 f"(best {max_vels.max():.2f} m/s)",
+            foreground="green")
+
+    def run_sweep_threaded(self):
+        """Run the sweep numerics on a worker thread"""
+        try:
+            snapshot = self._snapshot_params()
+            spec = self._sweep_spec()
+        except tk.TclError as e:
+            messagebox.showerror("Error", f"Invalid parameter value: {e}")
+            self.status_label.config(text="Invalid parameter", foreground="red")
+            return
+        self.status_label.config(text="Running sweep...", foreground="orange")
+        thread = threading.Thread(target=self._sweep_to_main,
+                                  args=(snapshot, spec))
+        thread.daemon = True
+        thread.start()
+
+    def _sweep_to_main(self, params, spec):
+        """Worker-thread entry point for a sweep"""
+        try:
+            result = self._compute_sweep(params, *spec)
+        except Exception as e:
+            self.root.after(0, self._report_failure, "Sweep", e)
+            return
+        self.root.after(0, self._render_sweep, result)
+
     def reset_parameters(self):
         """Reset all parameters to default values"""
         defaults = {
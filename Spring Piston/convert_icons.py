@@ -0,0 +1,60 @@
+"""Convert icon PNGs into multi-size Windows .ico files for the exe build.
+
+Requires Pillow (build-time only, not a runtime dependency):
+    pip install pillow
+
+Usage:
+    python convert_icons.py [icon.png ...]
+
+With no arguments, converts every .png in ./icons/. Each PNG becomes a
+.ico next to it containing all the standard Windows icon resolutions.
+"""
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+# Standard Windows icon resolutions, largest first
+ICO_SIZES = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+
+
+def png_to_ico(png_path, ico_path):
+    """Write a multi-resolution .ico from a single PNG.
+
+    save(sizes=...) lets PIL generate all sub-images internally from the
+    one decoded source, instead of resampling the PNG once per size at
+    the Python level.
+    """
+    img = Image.open(png_path)
+    if img.width > 256 or img.height > 256:
+        # ICO tops out at 256x256; one downscale up front keeps the
+        # internal resamples small
+        img = img.resize((256, 256), Image.LANCZOS)
+    img.save(ico_path, format="ICO", sizes=ICO_SIZES)
+    print(f"{png_path} -> {ico_path}")
+
+
+def _convert(png_path):
+    """Module-level worker so it stays picklable for the process pool"""
+    png_to_ico(png_path, png_path.with_suffix(".ico"))
+
+
+def main():
+    if len(sys.argv) > 1:
+        icon_pngs = [Path(arg) for arg in sys.argv[1:]]
+    else:
+        icon_pngs = sorted(Path("icons").glob("*.png"))
+
+    if not icon_pngs:
+        print("No PNG icons found (pass paths or put them in ./icons/)")
+        return
+
+    # LANCZOS resampling is CPU-bound and independent per file, so fan
+    # the conversions out across cores
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_convert, icon_pngs))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-from matplotlib.ticker import MaxNLocator, ScalarFormatter
+from matplotlib.ticker import FuncFormatter, MaxNLocator
 from scipy.integrate import solve_ivp
+import numba
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import threading
+import queue
+import json
 import pickle
 from pathlib import Path
 
@@ -17,6 +20,110 @@ BAR_PER_PASCAL = 1e-5
 ML_PER_M3 = 1_000_000.0
 MS_PER_S = 1000.0
 
+@numba.njit(cache=True, fastmath=True)
+def _system(t, x, P):
+    """Define the system of first-order ODEs.
+
+    Lives at module level (instead of on the GUI class) so numba can compile
+    and cache it; all parameters come in through the flat float64 array P
+    built once per run by _build_params_array, with the per-run constants
+    (areas, initial volume, total spring compression) already folded in so
+    nothing invariant is recomputed per step.
+    """
+    d1, d2, p1, p2 = x[0], x[1], x[2], x[3]  # dart and plunger variables
+    p_0, p_2 = P[0], P[1]
+    area_b, area_p = P[2], P[3]
+    v_0, xsf = P[4], P[5]
+    gamma = P[6]
+    mass_d, mass_p = P[7], P[8]
+    L_0, k = P[9], P[10]
+
+    # Internal pressure calculation (with safety check, scalar max
+    # instead of np.maximum to stay cheap per call)
+    volume_ratio = max(((L_0 - p1) * area_p + d1 * area_b) / v_0, 1e-10)
+    p_t = p_0 / (volume_ratio ** gamma)
+
+    # Derivatives
+    dxdt = np.empty(4)
+    dxdt[0] = d2  # dart velocity
+    dxdt[1] = ((p_t - p_2) * area_b) / mass_d
+    dxdt[2] = p2  # plunger velocity
+    dxdt[3] = ((p_2 - p_t) * area_p + k * (xsf - p1)) / mass_p
+    return dxdt
+
+@numba.njit(cache=True, fastmath=True)
+def _jacobian(t, x, P):
+    """Analytic Jacobian of _system.
+
+    The only nonlinear coupling is through the internal pressure p_t, which
+    depends on dart position (d1) and plunger position (p1) via the volume
+    ratio; everything else is linear. Supplying this keeps LSODA from
+    finite-differencing the RHS to build its Jacobian.
+    """
+    d1, p1 = x[0], x[2]
+    area_b, area_p = P[2], P[3]
+    v_0 = P[4]
+    gamma = P[6]
+    mass_d, mass_p = P[7], P[8]
+    L_0, k = P[9], P[10]
+
+    volume_ratio = max(((L_0 - p1) * area_p + d1 * area_b) / v_0, 1e-10)
+    p_t = P[0] / (volume_ratio ** gamma)
+
+    # dp_t/dd1 and dp_t/dp1 (barrel volume grows with d1, shrinks with p1)
+    dpt_dd1 = -gamma * p_t * area_b / (v_0 * volume_ratio)
+    dpt_dp1 = gamma * p_t * area_p / (v_0 * volume_ratio)
+
+    J = np.zeros((4, 4))
+    J[0, 1] = 1.0
+    J[1, 0] = area_b * dpt_dd1 / mass_d
+    J[1, 2] = area_b * dpt_dp1 / mass_d
+    J[2, 3] = 1.0
+    J[3, 0] = -area_p * dpt_dd1 / mass_p
+    J[3, 2] = -area_p * dpt_dp1 / mass_p - k / mass_p
+    return J
+
+
+@numba.njit(cache=True, fastmath=True, parallel=True)
+def _compute_state_arrays(d1_pos, p1_pos, P):
+    """Vectorized twin of the state computation in _system.
+
+    Evaluates volume ratio, internal pressure and system volume for whole
+    position arrays in one parallel pass, so the post-solve code shares the
+    formula with the RHS instead of re-deriving it in NumPy.
+    """
+    p_0 = P[0]
+    area_b, area_p = P[2], P[3]
+    v_0 = P[4]
+    gamma = P[6]
+    L_0 = P[9]
+
+    n = d1_pos.shape[0]
+    volume_ratio = np.empty(n)
+    p_t = np.empty(n)
+    v_t = np.empty(n)
+    for i in numba.prange(n):
+        v = (L_0 - p1_pos[i]) * area_p + d1_pos[i] * area_b
+        vr = max(v / v_0, 1e-10)
+        volume_ratio[i] = vr
+        p_t[i] = p_0 / (vr ** gamma)
+        v_t[i] = v
+    return volume_ratio, p_t, v_t
+
+def _warm_up_kernels():
+    """Force numba to compile-or-load every kernel on tiny inputs.
+
+    With cache=True this is a quick disk load on all runs after the very
+    first, so the latency lands in GUI startup rather than inside the
+    first simulation the user triggers.
+    """
+    x = np.zeros(4)
+    P = np.ones(11)
+    _system(0.0, x, P)
+    _jacobian(0.0, x, P)
+    _compute_state_arrays(x[:2], x[:2], P)
+
+
 class DartPlungerSimulatorGUI:
     def __init__(self, root):
         self.root = root
@@ -59,7 +166,14 @@ class DartPlungerSimulatorGUI:
         self._hover_connection = None
         self._draw_connection = None
         self._hover_cache = {}
-        
+        self._axis_scales = {}
+        self._spring_buf = None
+        self._t_plot = None
+        self._t_plot_key = None
+        self._result_queue = queue.Queue()
+        self._pending_run = None
+        
+        _warm_up_kernels()  # absorb JIT compile/load before the first run
         self.setup_gui()
         self.run_simulation()  # Initial simulation
 
@@ -143,12 +257,14 @@ class DartPlungerSimulatorGUI:
             
             # Entry with larger font for readability
             display_value = self._param_to_display(key, self.params[key])
-            var = tk.DoubleVar(value=display_value)
+            # StringVar avoids Tcl revalidating/coercing on every keystroke;
+            # the text is parsed once in _update_params_from_vars
+            var = tk.StringVar(value=str(display_value))
             self.param_vars[key] = var
             
             entry = ttk.Entry(param_frame, textvariable=var, width=12, font=('Arial', 10))
             entry.pack(side=tk.LEFT, padx=5)
-            entry.bind('<Return>', lambda e: self.run_simulation_threaded())
+            entry.bind('<Return>', lambda e: self._schedule_run())
         
         # Action buttons
         button_frame = ttk.Frame(parent)
@@ -183,10 +299,27 @@ class DartPlungerSimulatorGUI:
                                      font=('Arial', 10))
         self.status_label.pack(pady=10)
         
+    # Static layout of the 3x3 plot grid: title, x-label, y-label, line
+    # color, whether the x-axis is pinned to the simulation time span, and
+    # the SI -> display-unit scale for each axis. Lines carry raw SI data;
+    # the scales are applied only in tick labels and tooltips, so no
+    # converted copies of the arrays are ever made.
+    _PLOT_DEFS = [
+        ('Dart Position vs Time', 'Time (ms)', 'Position (mm)', 'blue', True, MS_PER_S, MM_PER_METER),
+        ('Dart Velocity vs Time', 'Time (ms)', 'Velocity (fps)', 'red', True, MS_PER_S, FPS_PER_MPS),
+        ('Dart Velocity vs Dart Position', 'Dart Position (mm)', 'Velocity (fps)', 'purple', False, MM_PER_METER, FPS_PER_MPS),
+        ('Plunger Position vs Time', 'Time (ms)', 'Position (mm)', 'green', True, MS_PER_S, MM_PER_METER),
+        ('Plunger Velocity vs Time', 'Time (ms)', 'Velocity (fps)', 'magenta', True, MS_PER_S, FPS_PER_MPS),
+        ('Plunger Position vs Dart Position', 'Dart Position (mm)', 'Plunger Position (mm)', 'brown', False, MM_PER_METER, MM_PER_METER),
+        ('System Pressure vs Time', 'Time (ms)', 'Pressure (bar)', 'cyan', True, MS_PER_S, BAR_PER_PASCAL),
+        ('System Volume vs Time', 'Time (ms)', 'Volume (mL)', 'orange', True, MS_PER_S, ML_PER_M3),
+        ('Pressure vs Dart Position', 'Dart Position (mm)', 'Pressure (bar)', 'teal', False, MM_PER_METER, BAR_PER_PASCAL),
+    ]
+
     def create_plots(self, parent):
         # Create very large matplotlib figure for maximum readability
         self.fig = Figure(figsize=(18, 12), dpi=100)
-        
+
         # Create 3x3 subplot layout with generous spacing
         self.axes = []
         for i in range(9):
@@ -202,13 +335,30 @@ class DartPlungerSimulatorGUI:
             wspace=0.35,    # Width spacing between subplots
             hspace=0.45     # Height spacing between subplots
         )
-        
+
+        # Build the persistent artists once: one Line2D and one tooltip
+        # annotation per axes, plus all static titles/labels/grid. Runs
+        # only update the line data instead of clearing and replotting.
+        for ax, (title, xlabel, ylabel, color, _, xscale, yscale) in zip(self.axes, self._PLOT_DEFS):
+            self._configure_axis(ax, title, xlabel, ylabel, color, xscale, yscale)
+
         # Embed in tkinter with scrollbars if needed
         canvas_frame = ttk.Frame(parent)
         canvas_frame.pack(fill=tk.BOTH, expand=True)
         
         self.canvas = FigureCanvasTkAgg(self.fig, canvas_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Match the figure raster to the actual widget before the first
+        # draw: at the fixed 18x12 in / 100 dpi the initial render is
+        # 2.16 M pixels that Tk then rescales to fit. TkAgg keeps the
+        # figure in sync with the widget on later <Configure> events.
+        self.root.update_idletasks()
+        widget = self.canvas.get_tk_widget()
+        width, height = widget.winfo_width(), widget.winfo_height()
+        if width > 1 and height > 1:
+            self.fig.set_size_inches(width / self.fig.dpi, height / self.fig.dpi)
+
         self._hover_connection = self.canvas.mpl_connect("motion_notify_event", self._on_plot_hover)
         self._draw_connection = self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
         
@@ -223,6 +373,46 @@ class DartPlungerSimulatorGUI:
         except Exception as e:
             print(f"Navigation toolbar not available: {e}")
 
+    def _configure_axis(self, ax, title, xlabel, ylabel, color, xscale, yscale):
+        """One-time static setup for a subplot: persistent line artist,
+        labels, grid, tick style, unit-converting tick formatters, and the
+        hover tooltip annotation. Called once per axes at figure build;
+        nothing here runs per simulation.
+        """
+        line, = ax.plot([], [], color=color, linewidth=3)
+        self.hover_lines.append(line)
+        self._axis_scales[ax] = (xscale, yscale)
+        ax.set_xlabel(xlabel, fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='both', labelsize=11)
+        ax.tick_params(axis='x', labelrotation=0)
+
+        # The lines hold SI data; the display units only exist in the tick
+        # labels (plain notation), so no converted arrays are allocated
+        ax.xaxis.set_major_formatter(
+            FuncFormatter(lambda v, _, s=xscale: f'{v * s:g}'))
+        ax.yaxis.set_major_formatter(
+            FuncFormatter(lambda v, _, s=yscale: f'{v * s:g}'))
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=5))
+
+        annotation = ax.annotate(
+            "",
+            xy=(0, 0),
+            xytext=(15, 15),
+            textcoords="offset points",
+            bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=1.0),
+            arrowprops=dict(arrowstyle="->", color="black"),
+            zorder=20
+        )
+        annotation.set_visible(False)
+        annotation.set_clip_on(False)
+        if annotation.arrow_patch is not None:
+            annotation.arrow_patch.set_zorder(19)
+            annotation.arrow_patch.set_clip_on(False)
+        self.hover_annotations[ax] = annotation
+
     def _on_plot_hover(self, event):
         """Handle mouse motion events to show tooltips with exact values."""
         if not self.hover_annotations or not self.hover_lines:
@@ -295,9 +485,10 @@ class DartPlungerSimulatorGUI:
         annotation.xytext = (offset_x, offset_y)
         annotation.set_ha(horiz_align)
         annotation.set_va(vert_align)
+        xscale, yscale = self._axis_scales.get(ax, (1.0, 1.0))
         annotation.set_text(
-            f"{ax.get_xlabel()}: {self._format_tooltip_value(x_val)}\n"
-            f"{ax.get_ylabel()}: {self._format_tooltip_value(y_val)}"
+            f"{ax.get_xlabel()}: {self._format_tooltip_value(x_val * xscale)}\n"
+            f"{ax.get_ylabel()}: {self._format_tooltip_value(y_val * yscale)}"
         )
         if not annotation.get_visible():
             annotation.set_visible(True)
@@ -354,160 +545,141 @@ class DartPlungerSimulatorGUI:
             return f"{value:.2f}"
         return f"{value:.1f}"
         
-    def system(self, t, x):
-        """Define the system of first-order ODEs"""
-        d1, d2, p1, p2 = x  # dart and plunger variables
-        
-        # Calculate areas
-        area_b = np.pi * (self.params['D_b']**2) / 4
-        area_p = np.pi * (self.params['D_p']**2) / 4
-        v_0 = self.params['L_0'] * area_p
-        xsf = self.params['xso'] + self.params['L_0']
-        
-        # Internal pressure calculation (with safety checks)
-        volume_ratio = np.maximum(
-            ((self.params['L_0'] - p1) * area_p + d1 * area_b) / v_0,
-            1e-10  # Prevent division by zero
-        )
-        p_t = self.params['p_0'] / (volume_ratio ** self.params['gamma'])
-        
-        # Derivatives
-        dd1dt = d2  # dart velocity
-        dp1dt = p2  # plunger velocity
-        
-        # Accelerations
-        dp2dt = ((self.params['p_2'] - p_t) * area_p + 
-                self.params['k'] * (xsf - p1)) / self.params['mass_p']
-        dd2dt = ((p_t - self.params['p_2']) * area_b) / self.params['mass_d']
-        
-        return [dd1dt, dd2dt, dp1dt, dp2dt]
-        
+    def _build_params_array(self, params):
+        """Pack the SI parameters into the flat array the jitted RHS expects.
+
+        The quantities that stay constant for a whole integration (areas,
+        initial volume, total spring compression) are computed here, once
+        per run, instead of on every RHS call.
+        """
+        area_b = np.pi * (params['D_b']**2) / 4
+        area_p = np.pi * (params['D_p']**2) / 4
+        return np.array([
+            params['p_0'], params['p_2'],
+            area_b, area_p,
+            params['L_0'] * area_p,            # v_0
+            params['xso'] + params['L_0'],     # xsf
+            params['gamma'],
+            params['mass_d'], params['mass_p'],
+            params['L_0'], params['k']
+        ], dtype=np.float64)
+
     def run_simulation(self):
+        """Synchronous compute + render; used for the initial run"""
         try:
-            # Update parameters
             self._update_params_from_vars()
-            
-            # Solve ODE
-            x0 = [0, 0, 0, 0]
-            t_span = (0, self.params['end_time'])
-            t_eval = np.linspace(0, self.params['end_time'], int(self.params['n_points']))
-            
-            sol = solve_ivp(self.system, t_span, x0, t_eval=t_eval)
-            
-            if not sol.success:
-                raise Exception("ODE solver failed")
-            
-            # Extract results
-            d1_pos, d1_vel, p1_pos, p1_vel = sol.y
-            time_ms = sol.t * MS_PER_S
-            
-            # Calculate derived quantities
-            area_b = np.pi * (self.params['D_b']**2) / 4
-            area_p = np.pi * (self.params['D_p']**2) / 4
-            v_0 = self.params['L_0'] * area_p
-            xsf = self.params['xso'] + self.params['L_0']
-            
-            # Avoid division by zero or negative values
-            volume_ratio = np.maximum(
-                ((self.params['L_0'] - p1_pos) * area_p + d1_pos * area_b) / v_0,
-                1e-10
-            )
-            p_t_array = self.params['p_0'] / (volume_ratio ** self.params['gamma'])
-            v_t_array = (self.params['L_0'] - p1_pos) * area_p + area_b * d1_pos
-            spring_force = self.params['k'] * (xsf - p1_pos)
-
-            # Prepare data in display units
-            d1_pos_mm = d1_pos * MM_PER_METER
-            d1_vel_fps = d1_vel * FPS_PER_MPS
-            p1_pos_mm = p1_pos * MM_PER_METER
-            p1_vel_fps = p1_vel * FPS_PER_MPS
-            p_t_bar = p_t_array * BAR_PER_PASCAL
-            v_t_ml = v_t_array * ML_PER_M3
-            
-            # Clear and plot with large, readable formatting
-            self.hover_lines = []
-            self.hover_annotations = {}
-            self._hover_cache = {}
-            for ax in self.axes:
-                ax.clear()
-            
-            # Configure all axes for maximum readability
-            plot_configs = [
-                (time_ms, d1_pos_mm, 'Dart Position vs Time', 'Time (ms)', 'Position (mm)', 'blue', True),
-                (time_ms, d1_vel_fps, 'Dart Velocity vs Time', 'Time (ms)', 'Velocity (fps)', 'red', True),
-                (d1_pos_mm, d1_vel_fps, 'Dart Velocity vs Dart Position', 'Dart Position (mm)', 'Velocity (fps)', 'purple', False),
-                (time_ms, p1_pos_mm, 'Plunger Position vs Time', 'Time (ms)', 'Position (mm)', 'green', True),
-                (time_ms, p1_vel_fps, 'Plunger Velocity vs Time', 'Time (ms)', 'Velocity (fps)', 'magenta', True),
-                (d1_pos_mm, p1_pos_mm, 'Plunger Position vs Dart Position', 'Dart Position (mm)', 'Plunger Position (mm)', 'brown', False),
-                (time_ms, p_t_bar, 'System Pressure vs Time', 'Time (ms)', 'Pressure (bar)', 'cyan', True),
-                (time_ms, v_t_ml, 'System Volume vs Time', 'Time (ms)', 'Volume (mL)', 'orange', True),
-                (d1_pos_mm, p_t_bar, 'Pressure vs Dart Position', 'Dart Position (mm)', 'Pressure (bar)', 'teal', False),
-            ]
-            
-            for i, (x_data, y_data, title, xlabel, ylabel, color, use_time_xlim) in enumerate(plot_configs):
-                ax = self.axes[i]
-                line, = ax.plot(x_data, y_data, color=color, linewidth=3)
-                self.hover_lines.append(line)
-                ax.set_xlabel(xlabel, fontsize=12)
-                ax.set_ylabel(ylabel, fontsize=12)
-                ax.grid(True, alpha=0.3)
-                ax.tick_params(axis='both', labelsize=11)
-                ax.tick_params(axis='x', labelrotation=0)
-                if use_time_xlim:
-                    ax.set_xlim(left=0, right=self.params['end_time'] * MS_PER_S)
-                else:
-                    x_min = np.nanmin(x_data)
-                    x_max = np.nanmax(x_data)
-                    if np.isfinite(x_min) and np.isfinite(x_max):
-                        if x_min == x_max:
-                            span = abs(x_min) * 0.05 or 1.0
-                            ax.set_xlim(x_min - span, x_max + span)
-                        else:
-                            ax.set_xlim(x_min, x_max)
-                if np.nanmin(y_data) >= 0:
-                    ax.set_ylim(bottom=0)
-                ax.set_title(title, fontsize=14, fontweight='bold')
-
-                # Keep both axes in plain notation
-                x_formatter = ScalarFormatter(useMathText=False)
-                x_formatter.set_scientific(False)
-                x_formatter.set_useOffset(False)
-                ax.xaxis.set_major_formatter(x_formatter)
-
-                y_formatter = ScalarFormatter(useMathText=False)
-                y_formatter.set_scientific(False)
-                y_formatter.set_useOffset(False)
-                ax.yaxis.set_major_formatter(y_formatter)
-                ax.xaxis.set_major_locator(MaxNLocator(nbins=5))
-
-                annotation = ax.annotate(
-                    "",
-                    xy=(0, 0),
-                    xytext=(15, 15),
-                    textcoords="offset points",
-                    bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=1.0),
-                    arrowprops=dict(arrowstyle="->", color="black"),
-                    zorder=20
-                )
-                annotation.set_visible(False)
-                annotation.set_clip_on(False)
-                if annotation.arrow_patch is not None:
-                    annotation.arrow_patch.set_zorder(19)
-                    annotation.arrow_patch.set_clip_on(False)
-                self.hover_annotations[ax] = annotation
-            
-            self.canvas.draw()
-            
-            # Update results summary
-            self.update_results_summary(sol, d1_pos, d1_vel, p1_pos, p1_vel, p_t_array, v_t_array)
-            
-            self.status_label.config(text="Simulation completed successfully", 
-                                   foreground="green")
-            
+            self._render(self._compute(dict(self.params)))
         except Exception as e:
             messagebox.showerror("Error", f"Simulation failed: {str(e)}")
             self.status_label.config(text="Simulation failed", foreground="red")
-    
+
+    def _compute(self, params):
+        """Numeric half of a run: solve the ODE and build the derived and
+        display-unit arrays. Works on a snapshot of the parameters and
+        touches no Tk or matplotlib state, so it is safe to run on a
+        worker thread while the user keeps editing.
+        """
+        # Solve ODE (parameters go through args= so the jitted RHS
+        # sees plain floats instead of the params dict)
+        P = self._build_params_array(params)
+        x0 = [0, 0, 0, 0]
+        t_span = (0, params['end_time'])
+
+        # LSODA with the analytic Jacobian handles the stiff pressure
+        # spike early in the shot without finite-differencing the RHS.
+        # dense_output lets the solver take tolerance-driven steps; the
+        # trajectory is then sampled at plot resolution afterwards, so
+        # n_points no longer forces extra solver evaluations.
+        sol = solve_ivp(_system, t_span, x0, args=(P,),
+                        method='LSODA', jac=_jacobian, dense_output=True)
+
+        if not sol.success:
+            raise Exception("ODE solver failed")
+
+        # Sample the dense solution at plot resolution. The grid is cached
+        # across runs: scipy's OdeSolver objects expose no supported
+        # re-initialization (and LSODA holds state Fortran-side), so the
+        # per-run allocations that can safely be reused live on our side.
+        key = (int(params['n_points']), params['end_time'])
+        if self._t_plot_key != key:
+            self._t_plot = np.linspace(0, params['end_time'], key[0])
+            self._t_plot_key = key
+        t_plot = self._t_plot
+        d1_pos, d1_vel, p1_pos, p1_vel = sol.sol(t_plot)
+
+        # Total spring compression was already computed into P
+        xsf = P[5]
+
+        if self._spring_buf is None or self._spring_buf.shape[0] != d1_pos.shape[0]:
+            self._spring_buf = np.empty(d1_pos.shape[0])
+        spring_force = self._spring_buf
+
+        # Pressure and volume come from the same jitted formula the RHS
+        # uses, evaluated across all sample points in one parallel pass
+        _, p_t_array, v_t_array = _compute_state_arrays(d1_pos, p1_pos, P)
+
+        np.subtract(xsf, p1_pos, out=spring_force)
+        spring_force *= params['k']
+
+        # The plots take raw SI arrays; display units are applied by the
+        # axis tick formatters, so no converted copies are built here
+        return {
+            'plot_data': [
+                (t_plot, d1_pos),
+                (t_plot, d1_vel),
+                (d1_pos, d1_vel),
+                (t_plot, p1_pos),
+                (t_plot, p1_vel),
+                (d1_pos, p1_pos),
+                (t_plot, p_t_array),
+                (t_plot, v_t_array),
+                (d1_pos, p_t_array),
+            ],
+            'end_time': params['end_time'],
+            'summary_args': (sol, d1_pos, d1_vel, p1_pos, p1_vel,
+                             p_t_array, v_t_array),
+        }
+
+    def _render(self, result):
+        """Rendering half of a run: update the persistent artists and the
+        Tk widgets. Must only run on the Tk main loop.
+        """
+        # Update the persistent lines in place instead of clearing and
+        # rebuilding every artist; the canvas then only re-renders data.
+        # Tooltips from the previous run would point at stale data, so
+        # hide them before the lines move.
+        self._hover_cache = {}
+        self._hide_all_annotations()
+
+        for i, (x_data, y_data) in enumerate(result['plot_data']):
+            ax = self.axes[i]
+            use_time_xlim = self._PLOT_DEFS[i][4]
+            self.hover_lines[i].set_data(x_data, y_data)
+            ax.relim()
+            ax.autoscale_view()
+            if use_time_xlim:
+                ax.set_xlim(left=0, right=result['end_time'])
+            else:
+                x_min = np.nanmin(x_data)
+                x_max = np.nanmax(x_data)
+                if np.isfinite(x_min) and np.isfinite(x_max):
+                    if x_min == x_max:
+                        span = abs(x_min) * 0.05 or 1.0
+                        ax.set_xlim(x_min - span, x_max + span)
+                    else:
+                        ax.set_xlim(x_min, x_max)
+            if np.nanmin(y_data) >= 0:
+                ax.set_ylim(bottom=0)
+
+        # Only the updated line artists need re-rendering
+        self.canvas.draw_idle()
+
+        # Update results summary
+        self.update_results_summary(*result['summary_args'])
+
+        self.status_label.config(text="Simulation completed successfully",
+                                 foreground="green")
+
     def update_results_summary(self, sol, d1_pos, d1_vel, p1_pos, p1_vel, p_t_array, v_t_array):
         """Update the results text widget"""
         final_dart_pos_mm = d1_pos[-1] * MM_PER_METER
@@ -526,7 +698,7 @@ class DartPlungerSimulatorGUI:
         results = f"""SIMULATION RESULTS
 {'='*40}
 Time: {self.params['end_time'] * MS_PER_S:.3f} ms
-Points: {len(sol.t)}
+Points: {len(d1_pos)}
 Success: {sol.success}
 
 DART RESULTS
@@ -552,32 +724,82 @@ Max Volume: {max_volume_ml:.3f} mL
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(1.0, results)
     
+    def _schedule_run(self):
+        """Debounce parameter edits: coalesce a burst of <Return> presses
+        into a single simulation 250 ms after the last one.
+        """
+        if self._pending_run is not None:
+            self.root.after_cancel(self._pending_run)
+        self._pending_run = self.root.after(250, self._run_debounced)
+
+    def _run_debounced(self):
+        self._pending_run = None
+        self.run_simulation_threaded()
+
     def run_simulation_threaded(self):
-        """Run simulation in thread to prevent GUI freezing"""
+        """Run the numerics on a worker thread to prevent GUI freezing.
+
+        Tk and the Tk canvas backend are not thread-safe, so only _compute
+        runs on the worker; the result is handed back through a queue and
+        rendered from the main loop by _drain_plot_queue.
+        """
+        if self._pending_run is not None:
+            # An explicit run supersedes any debounced one still pending
+            self.root.after_cancel(self._pending_run)
+            self._pending_run = None
+        try:
+            self._update_params_from_vars()  # Tk var reads stay on the main thread
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            self.status_label.config(text="Invalid parameter", foreground="red")
+            return
         self.status_label.config(text="Running simulation...", foreground="orange")
-        thread = threading.Thread(target=self.run_simulation)
+        thread = threading.Thread(target=self._compute_to_queue,
+                                  args=(dict(self.params),))
         thread.daemon = True
         thread.start()
+        self.root.after(20, self._drain_plot_queue)
+
+    def _compute_to_queue(self, params):
+        """Worker-thread entry point: compute and enqueue the result"""
+        try:
+            self._result_queue.put(('ok', self._compute(params)))
+        except Exception as e:
+            self._result_queue.put(('error', e))
+
+    def _drain_plot_queue(self):
+        """Poll the worker result from the Tk main loop and render it"""
+        try:
+            kind, payload = self._result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(20, self._drain_plot_queue)
+            return
+
+        if kind == 'error':
+            messagebox.showerror("Error", f"Simulation failed: {str(payload)}")
+            self.status_label.config(text="Simulation failed", foreground="red")
+        else:
+            self._render(payload)
     
     def save_parameters(self):
-        """Save current parameters to a pickle file"""
+        """Save current parameters to a JSON file"""
         try:
             self._update_params_from_vars()
-        except tk.TclError as e:
+        except ValueError as e:
             messagebox.showerror("Error", f"Invalid parameter value: {e}")
             return
         
         file_path = filedialog.asksaveasfilename(
             title="Save Parameter Set",
-            defaultextension=".pkl",
-            filetypes=[("Pickle files", "*.pkl"), ("All files", "*.*")]
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if not file_path:
             return
         
         try:
-            with open(file_path, 'wb') as outfile:
-                pickle.dump(self.params, outfile)
+            with open(file_path, 'w') as outfile:
+                json.dump(self.params, outfile, indent=2)
             self._update_file_label(file_path)
             self.status_label.config(text="Parameters saved successfully", foreground="green")
         except Exception as exc:
@@ -585,17 +807,28 @@ Max Volume: {max_volume_ml:.3f} mL
             self.status_label.config(text="Parameter save failed", foreground="red")
     
     def load_parameters(self):
-        """Load parameters from a pickle file and rerun the simulation"""
+        """Load parameters from a JSON (or legacy pickle) file and rerun
+        the simulation"""
         file_path = filedialog.askopenfilename(
             title="Load Parameter Set",
-            filetypes=[("Pickle files", "*.pkl *.pickle"), ("All files", "*.*")]
+            filetypes=[("Parameter files", "*.json *.pkl *.pickle"),
+                       ("All files", "*.*")]
         )
         if not file_path:
             return
         
         try:
-            with open(file_path, 'rb') as infile:
-                loaded_params = pickle.load(infile)
+            with open(file_path, 'r') as infile:
+                loaded_params = json.load(infile)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            # Parameter sets saved by older versions were pickled
+            try:
+                with open(file_path, 'rb') as infile:
+                    loaded_params = pickle.load(infile)
+            except Exception as exc:
+                messagebox.showerror("Error", f"Failed to load parameters: {exc}")
+                self.status_label.config(text="Parameter load failed", foreground="red")
+                return
         except Exception as exc:
             messagebox.showerror("Error", f"Failed to load parameters: {exc}")
             self.status_label.config(text="Parameter load failed", foreground="red")
@@ -616,21 +849,29 @@ Max Volume: {max_volume_ml:.3f} mL
         
         for key, value in self.params.items():
             try:
-                display_value = self._param_to_display(key, value)
-                self.param_vars[key].set(display_value)
-            except tk.TclError:
+                display_value = self._param_to_display(key, float(value))
+            except (TypeError, ValueError):
                 messagebox.showerror("Error", f"Invalid value for parameter '{key}': {value}")
                 self.status_label.config(text="Parameter load failed", foreground="red")
                 return
+            self.param_vars[key].set(str(display_value))
         
         self._update_file_label(file_path)
         self.status_label.config(text="Parameters loaded successfully", foreground="green")
         self.run_simulation_threaded()
     
     def _update_params_from_vars(self):
-        """Sync internal param dict from GUI variables"""
+        """Sync internal param dict from GUI variables.
+
+        The entries hold plain strings; parse them here in one place and
+        raise a ValueError naming the offending field on bad input.
+        """
         for key, var in self.param_vars.items():
-            display_value = var.get()
+            text = var.get()
+            try:
+                display_value = float(text)
+            except ValueError:
+                raise ValueError(f"Invalid value for '{key}': {text!r}") from None
             self.params[key] = self._param_from_display(key, display_value)
 
     def _param_to_display(self, key, value):
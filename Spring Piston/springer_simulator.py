@@ -1,6 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp, cumulative_trapezoid
+import numba
 
 # Parameters - defined once at the top
 p_0 = 101325  # Initial pressure inside plunger tube (assumed to be atmospheric)
@@ -22,134 +22,255 @@ xsf = xso+L_0 #final total compression of spring
 k = 523*(11/5)  #spring constant n/m 
 v_0 = L_0*area_p   # Initial volume in cubic meters
 
-def system(t,x):
-    d1,d2,p1,p2 = x # dart variables, plunger variables 
-    
+@numba.njit(cache=True, fastmath=True)
+def system(t, x, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, out):
+    """Dart/plunger ODE right-hand side, numba-compiled.
+
+    Parameters come in as plain scalars so cached compilations never
+    bake in stale values of the header constants.
+    """
+    d1, d2, p1, p2 = x[0], x[1], x[2], x[3] # dart variables, plunger variables
+
     #internal pressure term function, used in both equations
     p_t = p_0 / (((((L_0-p1)*area_p+(d1)*area_b)/v_0)) ** gamma)
 
-    # Set the equations for the derivatives of the x vector 
-    dd1dt = d2  
-    dp1dt = p2 
     # Choose friction based on position
    # friction = fric1 if x1 <= 0.005 else fric2 #play with this
-    
-    # Calculate acceleration terms (factoring out common terms)
-    dp2dt =  ((p_2-p_t)*area_p+(k*((xsf)-p1)))/mass_p
-    dd2dt =  ((p_t-p_2)*area_b)/mass_d
-    
-    return [dd1dt,dd2dt,dp1dt,dp2dt]
-
-#solver gives us position and velocities of the dart and plunger 
-
-
-x0 = [0, 0,0,0]  # Initial state [d1(0), d2(0), p1(0), p2(0)]
-end_time = .02
-# Time span for the solution (start, end)
-t_span = (0, end_time)
-
-# Time points where solution is computed
-t_eval = np.linspace(0, end_time, 1500)
-
-# Solve the system of ODEs
-sol = solve_ivp(system, t_span, x0, t_eval=t_eval)
-
-# Calculate derived quantities for plotting
-d1_pos = sol.y[0]  # Dart position
-d1_vel = sol.y[1]  # Dart velocity
-p1_pos = sol.y[2]  # Plunger position
-p1_vel = sol.y[3]  # Plunger velocity
-
-# Calculate pressure over time
-p_t_array = p_0 / (((((L_0-p1_pos)*area_p+(d1_pos)*area_b)/v_0)) ** gamma)
-
-
-# Calculate volume over time
-v_t_array = ((L_0-p1_pos)*area_p) + (area_b*d1_pos)
-
-# Calculate spring force over time
-spring_force = k * (xsf - p1_pos)
-
-# Create comprehensive plots
-fig, ((ax1, ax2), (ax3, ax4), (ax5, ax6)) = plt.subplots(3, 2, figsize=(15, 12))
-
-# Plot 1: Dart Position vs Time
-ax1.plot(sol.t, d1_pos, 'b-', linewidth=2, label="Dart Position")
-ax1.set_xlabel('Time (s)')
-ax1.set_ylabel('Position (m)')
-ax1.set_title('Dart Position vs Time')
-ax1.legend()
-ax1.grid(True)
-
-# Plot 2: Dart Velocity vs Time
-ax2.plot(sol.t, d1_vel, 'r-', linewidth=2, label="Dart Velocity")
-ax2.set_xlabel('Time (s)')
-ax2.set_ylabel('Velocity (m/s)')
-ax2.set_title('Dart Velocity vs Time')
-ax2.legend()
-ax2.grid(True)
-
-# Plot 3: Plunger Position vs Time
-ax3.plot(sol.t, p1_pos, 'g-', linewidth=2, label="Plunger Position")
-ax3.set_xlabel('Time (s)')
-ax3.set_ylabel('Position (m)')
-ax3.set_title('Plunger Position vs Time')
-ax3.legend()
-ax3.grid(True)
-
-# Plot 4: Plunger Velocity vs Time
-ax4.plot(sol.t, p1_vel, 'm-', linewidth=2, label="Plunger Velocity")
-ax4.set_xlabel('Time (s)')
-ax4.set_ylabel('Velocity (m/s)')
-ax4.set_title('Plunger Velocity vs Time')
-ax4.legend()
-ax4.grid(True)
-
-# Plot 5: Pressure vs Time
-ax5.plot(sol.t, p_t_array, 'c-', linewidth=2, label="System Pressure")
-ax5.set_xlabel('Time (s)')
-ax5.set_ylabel('Pressure (Pa)')
-ax5.set_title('System Pressure vs Time')
-ax5.legend()
-ax5.grid(True)
-
-# Plot 6: Volume and Spring Force vs Time
-ax6_twin = ax6.twinx()
-line1 = ax6.plot(sol.t, v_t_array, 'orange', linewidth=2, label="System Volume")
-line2 = ax6_twin.plot(sol.t, spring_force, 'purple', linewidth=2, label="Spring Force")
-ax6.set_xlabel('Time (s)')
-ax6.set_ylabel('Volume (m³)', color='orange')
-ax6_twin.set_ylabel('Spring Force (N)', color='purple')
-ax6.set_title('Volume and Spring Force vs Time')
-
-# Combine legends
-lines1, labels1 = ax6.get_legend_handles_labels()
-lines2, labels2 = ax6_twin.get_legend_handles_labels()
-ax6.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
-ax6.grid(True)
-
-plt.tight_layout()
-plt.show()
-
-# Print some key results
-print("\n" + "="*60)
-print("SIMULATION RESULTS SUMMARY")
-print("="*60)
-print(f"Simulation time: {end_time} seconds")
-print(f"Number of data points: {len(sol.t)}")
-print(f"Integration successful: {sol.success}")
-print("-"*60)
-print(f"Final dart position: {d1_pos[-1]:.6f} m")
-print(f"Final dart velocity: {d1_vel[-1]:.3f} m/s")
-print(f"Maximum dart velocity: {np.max(d1_vel):.3f} m/s")
-print("-"*60)
-print(f"Final plunger position: {p1_pos[-1]:.6f} m")
-print(f"Final plunger velocity: {p1_vel[-1]:.3f} m/s")
-print(f"Maximum plunger velocity: {np.max(p1_vel):.3f} m/s")
-print("-"*60)
-print(f"Final system pressure: {p_t_array[-1]:.0f} Pa")
-print(f"Minimum system pressure: {np.min(p_t_array):.0f} Pa")
-print(f"Final system volume: {v_t_array[-1]:.2e} m³")
-print(f"Maximum system volume: {np.max(v_t_array):.2e} m³")
-print("="*60)
 
+    # Calculate acceleration terms (factoring out common terms),
+    # filling the caller-owned buffer so the step loop allocates nothing
+    out[0] = d2
+    out[1] = ((p_t-p_2)*area_b)/mass_d
+    out[2] = p2
+    out[3] = ((p_2-p_t)*area_p+(k*((xsf)-p1)))/mass_p
+
+
+@numba.njit(cache=True, fastmath=True)
+def _integrate_rk45(t_eval, y0, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, rtol, atol):
+    """Adaptive Dormand-Prince (RK45) integration over an output grid.
+
+    The whole step loop runs compiled instead of scipy's Python driver
+    calling back into the RHS once per stage. Steps adapt to the embedded
+    4th/5th-order error estimate and are clamped so every t_eval point is
+    landed on exactly; tolerances match solve_ivp's defaults unless the
+    caller loosens them.
+    """
+    n_out = t_eval.shape[0]
+    n_dim = y0.shape[0]
+    y_out = np.empty((n_dim, n_out))
+    y = y0.copy()
+    for j in range(n_dim):
+        y_out[j, 0] = y[j]
+
+    # All per-step work happens in these preallocated buffers; the RHS
+    # fills its out argument in place, so the step loop allocates nothing
+    k1 = np.empty(n_dim)
+    k2 = np.empty(n_dim)
+    k3 = np.empty(n_dim)
+    k4 = np.empty(n_dim)
+    k5 = np.empty(n_dim)
+    k6 = np.empty(n_dim)
+    k7 = np.empty(n_dim)
+    y_stage = np.empty(n_dim)
+    y_new = np.empty(n_dim)
+
+    t = t_eval[0]
+    h = (t_eval[-1] - t_eval[0]) / 100.0
+
+    for i in range(1, n_out):
+        t_target = t_eval[i]
+        while t < t_target - 1e-14:
+            h_step = min(h, t_target - t)
+            while True:
+                system(t, y, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k1)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * 0.2 * k1[j]
+                system(t + h_step * 0.2, y_stage, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k2)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (3.0 / 40.0 * k1[j]
+                                                  + 9.0 / 40.0 * k2[j])
+                system(t + h_step * 0.3, y_stage, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k3)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (44.0 / 45.0 * k1[j]
+                                                  - 56.0 / 15.0 * k2[j]
+                                                  + 32.0 / 9.0 * k3[j])
+                system(t + h_step * 0.8, y_stage, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k4)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (19372.0 / 6561.0 * k1[j]
+                                                  - 25360.0 / 2187.0 * k2[j]
+                                                  + 64448.0 / 6561.0 * k3[j]
+                                                  - 212.0 / 729.0 * k4[j])
+                system(t + h_step * 8.0 / 9.0, y_stage, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k5)
+                for j in range(n_dim):
+                    y_stage[j] = y[j] + h_step * (9017.0 / 3168.0 * k1[j]
+                                                  - 355.0 / 33.0 * k2[j]
+                                                  + 46732.0 / 5247.0 * k3[j]
+                                                  + 49.0 / 176.0 * k4[j]
+                                                  - 5103.0 / 18656.0 * k5[j])
+                system(t + h_step, y_stage, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k6)
+                for j in range(n_dim):
+                    y_new[j] = y[j] + h_step * (35.0 / 384.0 * k1[j]
+                                                + 500.0 / 1113.0 * k3[j]
+                                                + 125.0 / 192.0 * k4[j]
+                                                - 2187.0 / 6784.0 * k5[j]
+                                                + 11.0 / 84.0 * k6[j])
+                system(t + h_step, y_new, p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf, mass_d, mass_p, k7)
+
+                # Embedded error estimate (5th minus 4th order solution)
+                norm = 0.0
+                for j in range(n_dim):
+                    err_j = h_step * ((35.0 / 384.0 - 5179.0 / 57600.0) * k1[j]
+                                      + (500.0 / 1113.0 - 7571.0 / 16695.0) * k3[j]
+                                      + (125.0 / 192.0 - 393.0 / 640.0) * k4[j]
+                                      + (-2187.0 / 6784.0 + 92097.0 / 339200.0) * k5[j]
+                                      + (11.0 / 84.0 - 187.0 / 2100.0) * k6[j]
+                                      - 1.0 / 40.0 * k7[j])
+                    scale = atol + rtol * max(abs(y[j]), abs(y_new[j]))
+                    norm += (err_j / scale) ** 2
+                norm = (norm / n_dim) ** 0.5
+
+                if norm <= 1.0 or h_step <= 1e-14:
+                    t += h_step
+                    for j in range(n_dim):
+                        y[j] = y_new[j]
+                    if norm > 0.0:
+                        h = h_step * min(5.0, max(0.2, 0.9 * norm ** -0.2))
+                    else:
+                        h = h_step * 5.0
+                    break
+                h_step *= max(0.2, 0.9 * norm ** -0.2)
+                h = h_step
+        for j in range(n_dim):
+            y_out[j, i] = y[j]
+    return y_out
+
+
+@numba.njit(cache=True, fastmath=True)
+def derive_state_arrays(d1_pos, p1_pos, p_0, area_b, area_p, gamma, L_0, v_0, k, xsf):
+    """Pressure, volume and spring force along the trajectory, one pass"""
+    n = d1_pos.shape[0]
+    p_t = np.empty(n)
+    v_t = np.empty(n)
+    f_spring = np.empty(n)
+    for i in range(n):
+        v = (L_0 - p1_pos[i]) * area_p + d1_pos[i] * area_b
+        v_t[i] = v
+        p_t[i] = p_0 / ((v / v_0) ** gamma)
+        f_spring[i] = k * (xsf - p1_pos[i])
+    return p_t, v_t, f_spring
+
+#solver gives us position and velocities of the dart and plunger
+
+
+def run_simulation(end_time=0.02, n_points=1500):
+    """Integrate the dart/plunger system and derive its state arrays.
+
+    Returns (t_eval, d1_pos, d1_vel, p1_pos, p1_vel, p_t, v_t,
+    spring_force). Factored out of the script body so notebooks and
+    parameter sweeps can call it without paying for the plots.
+    """
+    t_eval = np.linspace(0, end_time, n_points)
+
+    # Integrate with the compiled RK45 kernel (tolerances match the old
+    # solve_ivp defaults)
+    y = _integrate_rk45(t_eval, np.zeros(4),
+                        p_0, p_2, area_b, area_p, gamma, L_0, v_0, k, xsf,
+                        mass_d, mass_p, 1e-3, 1e-6)
+
+    p_t, v_t, spring_force = derive_state_arrays(
+        y[0], y[2], p_0, area_b, area_p, gamma, L_0, v_0, k, xsf)
+    return t_eval, y[0], y[1], y[2], y[3], p_t, v_t, spring_force
+
+
+def main():
+    end_time = .02
+
+    (t_eval, d1_pos, d1_vel, p1_pos, p1_vel,
+     p_t_array, v_t_array, spring_force) = run_simulation(end_time, 1500)
+
+    # Create comprehensive plots
+    fig, ((ax1, ax2), (ax3, ax4), (ax5, ax6)) = plt.subplots(3, 2, figsize=(15, 12))
+
+    # Plot 1: Dart Position vs Time
+    ax1.plot(t_eval, d1_pos, 'b-', linewidth=2, label="Dart Position")
+    ax1.set_xlabel('Time (s)')
+    ax1.set_ylabel('Position (m)')
+    ax1.set_title('Dart Position vs Time')
+    ax1.legend()
+    ax1.grid(True)
+
+    # Plot 2: Dart Velocity vs Time
+    ax2.plot(t_eval, d1_vel, 'r-', linewidth=2, label="Dart Velocity")
+    ax2.set_xlabel('Time (s)')
+    ax2.set_ylabel('Velocity (m/s)')
+    ax2.set_title('Dart Velocity vs Time')
+    ax2.legend()
+    ax2.grid(True)
+
+    # Plot 3: Plunger Position vs Time
+    ax3.plot(t_eval, p1_pos, 'g-', linewidth=2, label="Plunger Position")
+    ax3.set_xlabel('Time (s)')
+    ax3.set_ylabel('Position (m)')
+    ax3.set_title('Plunger Position vs Time')
+    ax3.legend()
+    ax3.grid(True)
+
+    # Plot 4: Plunger Velocity vs Time
+    ax4.plot(t_eval, p1_vel, 'm-', linewidth=2, label="Plunger Velocity")
+    ax4.set_xlabel('Time (s)')
+    ax4.set_ylabel('Velocity (m/s)')
+    ax4.set_title('Plunger Velocity vs Time')
+    ax4.legend()
+    ax4.grid(True)
+
+    # Plot 5: Pressure vs Time
+    ax5.plot(t_eval, p_t_array, 'c-', linewidth=2, label="System Pressure")
+    ax5.set_xlabel('Time (s)')
+    ax5.set_ylabel('Pressure (Pa)')
+    ax5.set_title('System Pressure vs Time')
+    ax5.legend()
+    ax5.grid(True)
+
+    # Plot 6: Volume and Spring Force vs Time
+    ax6_twin = ax6.twinx()
+    line1 = ax6.plot(t_eval, v_t_array, 'orange', linewidth=2, label="System Volume")
+    line2 = ax6_twin.plot(t_eval, spring_force, 'purple', linewidth=2, label="Spring Force")
+    ax6.set_xlabel('Time (s)')
+    ax6.set_ylabel('Volume (m³)', color='orange')
+    ax6_twin.set_ylabel('Spring Force (N)', color='purple')
+    ax6.set_title('Volume and Spring Force vs Time')
+
+    # Combine legends
+    lines1, labels1 = ax6.get_legend_handles_labels()
+    lines2, labels2 = ax6_twin.get_legend_handles_labels()
+    ax6.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
+    ax6.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+    # Print some key results
+    print("\n" + "="*60)
+    print("SIMULATION RESULTS SUMMARY")
+    print("="*60)
+    print(f"Simulation time: {end_time} seconds")
+    print(f"Number of data points: {len(t_eval)}")
+    print(f"Integration successful: {bool(np.all(np.isfinite(d1_vel)))}")
+    print("-"*60)
+    print(f"Final dart position: {d1_pos[-1]:.6f} m")
+    print(f"Final dart velocity: {d1_vel[-1]:.3f} m/s")
+    print(f"Maximum dart velocity: {np.max(d1_vel):.3f} m/s")
+    print("-"*60)
+    print(f"Final plunger position: {p1_pos[-1]:.6f} m")
+    print(f"Final plunger velocity: {p1_vel[-1]:.3f} m/s")
+    print(f"Maximum plunger velocity: {np.max(p1_vel):.3f} m/s")
+    print("-"*60)
+    print(f"Final system pressure: {p_t_array[-1]:.0f} Pa")
+    print(f"Minimum system pressure: {np.min(p_t_array):.0f} Pa")
+    print(f"Final system volume: {v_t_array[-1]:.2e} m³")
+    print(f"Maximum system volume: {np.max(v_t_array):.2e} m³")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()